@@ -1,4 +1,5 @@
 import re
+import struct
 from enum import Enum
 from random import randint
 from typing import Any, Callable, Dict, Generator, List, Optional
@@ -115,6 +116,20 @@ class SegmentType(Enum):
         return self == SegmentType.IPV6
 
 
+def wrap_add_16(data: bytearray, offset_num: int) -> bytearray:
+    """ write the 16 bit ones' complement checksum of data at offset_num """
+    data[offset_num : offset_num + 2] = b"\x00\x00"
+    # sum all big endian words at once and fold the carries back in afterwards,
+    # same result as adding the carry back after every word
+    checksum = sum(struct.unpack_from(f">{len(data) // 2}H", data))
+    if len(data) % 2:
+        checksum += data[-1] << 8  # odd length is padded with a zero byte
+    while checksum > 0xFFFF:
+        checksum = (checksum & 0xFFFF) + (checksum >> 16)
+    struct.pack_into(">H", data, offset_num, ~checksum & 0xFFFF)
+    return data
+
+
 class ValueRange(BaseModel):
     start_value: int
     step_value: int = Field(gt=0)
@@ -122,10 +137,22 @@ class ValueRange(BaseModel):
     action: ModifierActionOption
     restart_for_each_port: bool
     _current_count: int = 0  # counter start from 0
+    _span: int = 1  # count of values in one INC / DEC cycle
+    _sign: int = 1  # 1 for INC, -1 for DEC
+    _min_value: int = 0  # RANDOM lower boundary
+    _max_value: int = 0  # RANDOM upper boundary
 
     class Config:
         underscore_attrs_are_private = True
 
+    def __init__(self, **data: Dict[str, Any]) -> None:
+        super().__init__(**data)
+        self._sign = -1 if self.action == ModifierActionOption.DEC else 1
+        self._span = max(
+            1, self._sign * (self.stop_value - self.start_value) // self.step_value + 1
+        )
+        self._min_value, self._max_value = sorted((self.start_value, self.stop_value))
+
     def reset(self) -> None:
         self._current_count = 0
 
@@ -137,20 +164,15 @@ class ValueRange(BaseModel):
         return self._current_count
 
     def get_current_value(self) -> int:
-        if self.action == ModifierActionOption.INC:
-            current_value = self.start_value + self.current_count * self.step_value
-            if current_value > self.stop_value:
-                current_value = self.start_value
-                self.reset()
-        elif self.action == ModifierActionOption.DEC:
-            current_value = self.start_value - self.current_count * self.step_value
-            if current_value < self.stop_value:
-                current_value = self.start_value
-                self.reset()
+        if self.action == ModifierActionOption.RANDOM:
+            current_value = randint(self._min_value, self._max_value)
         else:
-            boundary = [self.start_value, self.stop_value]
-            current_value = randint(min(boundary), max(boundary))
-        self.set_current_count(self.current_count + 1)
+            # wrap back to start_value after the last value within stop_value
+            current_value = (
+                self.start_value
+                + self._sign * (self._current_count % self._span) * self.step_value
+            )
+        self._current_count += 1
         return current_value
 
 
@@ -199,8 +221,13 @@ class SegmentField(BaseModel):
     def check_value_range(self) -> None:
         if not self.value_range:
             return
-        max_val = max(self.value_range.start_value, self.value_range.stop_value)
-        theory_max = pow(2, self.bit_length)
+        value_range = self.value_range
+        max_val = (
+            value_range.stop_value
+            if value_range.stop_value > value_range.start_value
+            else value_range.start_value
+        )
+        theory_max = 1 << self.bit_length
         if max_val >= theory_max:  # why not fvr.stop_value >= can_max?
             raise Exception("invalid value range", self.name, theory_max)
 
@@ -229,9 +256,17 @@ class ProtocolSegment(BaseModel):
     type: SegmentType
     fields: List[SegmentField]
     checksum_offset: Optional[int]
+    _field_index: Dict[str, int] = {}  # field name -> position in fields
+
+    class Config:
+        underscore_attrs_are_private = True
 
     def __init__(self, **data: Dict[str, Any]) -> None:
         super().__init__(**data)
+        field_index: Dict[str, int] = {}
+        for index, field in enumerate(self.fields):
+            field_index.setdefault(field.name, index)
+        self._field_index = field_index
 
     @property
     def hw_modifiers(self) -> Generator["HWModifier", None, None]:
@@ -247,35 +282,18 @@ class ProtocolSegment(BaseModel):
             raise ValueError("checksum offset must digit")
         return value
 
-    def __wrap_add_16(self, data: bytearray, offset_num: int) -> bytearray:
-        checksum = 0
-        data[offset_num + 0] = 0
-        data[offset_num + 1] = 0
-        for i in range(0, len(data), 2):
-            w = (data[i + 0] << 8) + data[i + 1]
-            checksum += w
-            if checksum > 0xFFFF:
-                checksum = (1 + checksum) & 0xFFFF  # add carry back in as lsb
-        data[offset_num + 0] = 0xFF + 1 + (~(checksum >> 8))
-        data[offset_num + 1] = 0xFF + 1 + (~(checksum & 0xFF))
-        return data
-
     def prepare(self) -> bytearray:
-        result = ""
-        for f in self.fields:
-            field_binary_string = f.prepare()
-            result += field_binary_string
+        result = "".join(f.prepare() for f in self.fields)
         result = int(result, 2).to_bytes((len(result) + 7) // 8, byteorder="big")
         result = bytearray(result)
         if self.checksum_offset:
-            result = self.__wrap_add_16(result, self.checksum_offset)
+            result = wrap_add_16(result, self.checksum_offset)
         return result
 
     def __getitem__(self, field_name: str) -> "SegmentField":
-        for field in self.fields:
-            if field.name == field_name:
-                return field
-        raise KeyError(field_name)
+        if (index := self._field_index.get(field_name)) is None:
+            raise KeyError(field_name)
+        return self.fields[index]
 
     def __setitem__(self, field_name: str, new_value: "BinaryString") -> None:
         self[field_name].set_field_value(new_value)
@@ -292,6 +310,13 @@ class ProtocolSegment(BaseModel):
 class ProtocolSegmentProfileConfig(BaseModel):
     id: str = ""  
     segments: List[ProtocolSegment] = []
+    _packet_header_length: int = 0
+    _modifier_count: int = 0
+    _protocol_version: PortProtocolVersion = PortProtocolVersion.ETHERNET
+    _segment_id_list: List["ProtocolOption"] = []
+
+    class Config:
+        underscore_attrs_are_private = True
 
     def __getitem__(self, segment_type: "SegmentType") -> List["ProtocolSegment"]:
         return [
@@ -301,10 +326,8 @@ class ProtocolSegmentProfileConfig(BaseModel):
         ]
 
     def prepare(self) -> bytearray:
-        result = bytearray()
-        for s in self.segments:
-            result.extend(s.prepare())
-        return result
+        # join allocates the result once, with the total length of all segments
+        return bytearray().join([s.prepare() for s in self.segments])
 
     def get_segment(
         self, segment_type: "SegmentType", index: int = 0
@@ -313,38 +336,48 @@ class ProtocolSegmentProfileConfig(BaseModel):
 
     @property
     def protocol_version(self) -> "PortProtocolVersion":
-        v = PortProtocolVersion.ETHERNET
-        for i in self.segments:
-            if i.type == SegmentType.IPV6:
-                v = PortProtocolVersion.IPV6
-                break
-            elif i.type == SegmentType.IP:
-                v = PortProtocolVersion.IPV4
-                break
-        return v
+        return self._protocol_version
 
     @property
     def segment_id_list(self) -> List["ProtocolOption"]:
-        return [h.type.to_xmp() for h in self.segments]
+        return self._segment_id_list
 
     @property
     def packet_header_length(self) -> int:
         """byte header length for convenient use with xoa-driver"""
-        return sum(hs.bit_length for hs in self.segments) // 8
+        return self._packet_header_length
 
     @property
     def modifier_count(self) -> int:
-        return sum(hs.modifier_count for hs in self.segments)
+        return self._modifier_count
 
     def calc_segment_position(self) -> None:
+        """
+        set modifier byte positions, and summarize the segments in the same pass,
+        the segment types and lengths do not change after construction.
+        """
         total_bit_length = 0
+        modifier_count = 0
+        protocol_version = None
+        segment_id_list = []
         for segment in self.segments:
+            segment_id_list.append(segment.type.to_xmp())
+            if protocol_version is None:
+                if segment.type == SegmentType.IPV6:
+                    protocol_version = PortProtocolVersion.IPV6
+                elif segment.type == SegmentType.IP:
+                    protocol_version = PortProtocolVersion.IPV4
             for field in segment.fields:
                 if modifier := field.hw_modifier:
                     modifier.set_byte_segment_position(
                         (total_bit_length // 8) + modifier.offset
                     )
+                    modifier_count += 1
                 total_bit_length += field.bit_length
+        self._packet_header_length = total_bit_length // 8
+        self._modifier_count = modifier_count
+        self._protocol_version = protocol_version or PortProtocolVersion.ETHERNET
+        self._segment_id_list = segment_id_list
 
     def __init__(self, **data: Dict[str, Any]) -> None:
         super().__init__(**data)
@@ -67,7 +67,13 @@ async def set_arp_request(
             """
             destination_ip = peer_ip_properties.public_address
             
-        arp_mac = await send_arp_request(port_struct, ip_properties.address, destination_ip)
+        arp_cache = port_struct.properties.arp_cache
+        if destination_ip not in arp_cache:
+            # resolved address does not change during the test, only ask the xenaserver once per destination
+            arp_cache[destination_ip] = await send_arp_request(
+                port_struct, ip_properties.address, destination_ip
+            )
+        arp_mac = arp_cache[destination_ip]
         if is_gateway_scenario:
             """
             YOU have the responsibility to store the MAC address and use it in the test stream configuration phase as the DMAC of all streams on the port. 
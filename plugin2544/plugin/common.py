@@ -1,17 +1,40 @@
-import re
-from typing import TYPE_CHECKING, Dict, List, Tuple, Union
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, List, Sequence, Tuple, Union
+from xoa_driver import utils
 from ..utils import constants as const, field
 
 
 if TYPE_CHECKING:
+    from xoa_driver import misc
     from .structure import PortStruct
     from ..model.m_port_config import PortConfiguration
 
 
 def gen_macaddress(first_three_bytes: str, index: int) -> "field.MacAddress":
-    hex_num = hex(index)[2:].zfill(6)
-    last_three_bytes = "".join(re.findall(r".{2}", hex_num))
-    return field.MacAddress(f"{first_three_bytes}:{last_three_bytes}")
+    # index as the zero padded last three bytes, MacAddress validates and normalizes it
+    return field.MacAddress(f"{first_three_bytes}:{index:06X}")
+
+
+async def apply_in_batches(tokens: Sequence["misc.Token"]) -> List[Any]:
+    """
+    utils.apply sends all tokens on the connection of the first one and accepts at most
+    MAX_COMMANDS_PER_APPLY tokens, so tokens are grouped by connection and every group is sent in chunks.
+    groups of different testers run concurrently, results are returned in the order of the tokens
+    """
+    groups: Dict[Any, List[int]] = {}
+    for index, token in enumerate(tokens):
+        groups.setdefault(token.connection, []).append(index)
+    results: List[Any] = [None] * len(tokens)
+
+    async def apply_group(indices: List[int]) -> None:
+        for start in range(0, len(indices), const.MAX_COMMANDS_PER_APPLY):
+            chunk = indices[start : start + const.MAX_COMMANDS_PER_APPLY]
+            chunk_results = await utils.apply(*(tokens[index] for index in chunk))
+            for index, result in zip(chunk, chunk_results):
+                results[index] = result
+
+    await asyncio.gather(*(apply_group(indices) for indices in groups.values()))
+    return results
 
 
 def is_same_ipnetwork(port_struct: "PortStruct", peer_struct: "PortStruct") -> bool:
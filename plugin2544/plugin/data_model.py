@@ -9,12 +9,20 @@ if TYPE_CHECKING:
     from ..utils.interfaces import TestSuitePipe
 
 
+@dataclass(frozen=True)
+class AddressModifier:
+    # 16 bit hw modifier on the destination address, offset in bytes from the start of the address
+    addr_range: range
+    offset: int
+    mask: int
+
+
 @dataclass(frozen=True)
 class ArpRefreshData:
     # is_ipv4: bool
     source_ip: Union[IPv4Address, IPv6Address, None]
     source_mac: Optional[MacAddress]
-    addr_range: Optional[range]
+    addr_modifier: Optional[AddressModifier]
 
 
 @dataclass(frozen=True)
@@ -1,8 +1,7 @@
-import math
 import asyncio
-from xoa_driver import utils
-from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple, Union
-from .data_model import ArpRefreshData
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+from .common import apply_in_batches
+from .data_model import AddressModifier, ArpRefreshData
 from .setup_source_port_rates import setup_source_port_rates
 from ..utils import exceptions, constants as const
 from ..utils.scheduler import schedule
@@ -10,29 +9,49 @@ from ..utils.field import IPv4Address, IPv6Address
 from ..utils.packet import ARPPacket, MacAddress, NDPPacket
 from loguru import logger
 
+BROADCAST_MAC = "FFFFFFFFFFFF"
+MAC_LEARNING_ETHERTYPE = "FFFF"
+MAC_LEARNING_PADDINGS = "00" * 118
+
 if TYPE_CHECKING:
     from xoa_driver import misc
     from .test_resource import ResourceManager
     from .structure import PortStruct
 
 
-def get_dest_ip_modifier_addr_range(
+def get_dest_ip_modifier(
+    port_struct: "PortStruct",
+) -> Optional[AddressModifier]:
+    # the profile does not change after configuration, only scan it once per port
+    properties = port_struct.properties
+    if not properties.dest_ip_addr_modifier_resolved:
+        properties.dest_ip_addr_modifier = _get_dest_ip_modifier(port_struct)
+        properties.dest_ip_addr_modifier_resolved = True
+    return properties.dest_ip_addr_modifier
+
+
+def _get_dest_ip_modifier(
     port_struct: "PortStruct",
-) -> Optional[range]:
+) -> Optional[AddressModifier]:
     header_segments = port_struct.port_conf.profile.segments
     for header_segment in header_segments:
-        if (not header_segment.type.is_ipv4) or (not header_segment.type.is_ipv6):
+        if not (header_segment.type.is_ipv4 or header_segment.type.is_ipv6):
             continue
-
+        # only the first ip segment carries the destination address
         for field in header_segment.fields:
             if field.name in ("Dest IP Addr", "Dest IPv6 Addr") and (
                 modifier := field.hw_modifier
             ):
-                return range(
-                    modifier.start_value,
-                    modifier.stop_value + 1,
-                    modifier.step_value,
+                return AddressModifier(
+                    range(
+                        modifier.start_value,
+                        modifier.stop_value + 1,
+                        modifier.step_value,
+                    ),
+                    modifier.offset,
+                    int(modifier.mask, 16),
                 )
+        return None
     return None
 
 
@@ -43,43 +62,41 @@ def add_address_refresh_entry(
 ) -> None:  # AddAddressRefreshEntry
     """ARP REFRESH STEP 1: generate address_refresh_data_set"""
     # is_ipv4 = port_struct.port_conf.profile.protocol_version.is_ipv4
-    addr_range = get_dest_ip_modifier_addr_range(port_struct)
-    port_struct.properties.address_refresh_data_set.add(
-        ArpRefreshData(source_ip, source_mac, addr_range)
-    )
-
-
-def get_bytes_from_macaddress(dmac: "MacAddress") -> Iterator[str]:
-    for i in range(0, len(dmac), 3):
-        yield dmac[i : i + 2]
+    refresh_data = port_struct.properties.address_refresh_data_set
+    key = (source_ip, source_mac)
+    if key not in refresh_data:
+        addr_modifier = get_dest_ip_modifier(port_struct)
+        refresh_data[key] = ArpRefreshData(source_ip, source_mac, addr_modifier)
 
 
 def get_link_local_uci_ipv6address(dmac: "MacAddress") -> str:
-    b = get_bytes_from_macaddress(dmac)
-    return f"FE80000000000000{int(next(b)) | 2 }{next(b)}{next(b)}FFFE{next(b)}{next(b)}{next(b)}"
+    """ link local address with modified EUI-64 interface id, universal/local bit of mac flipped """
+    b = bytes.fromhex(dmac.to_hexstring())
+    return f"FE80::{b[0] ^ 0x02:02X}{b[1]:02X}:{b[2]:02X}FF:FE{b[3]:02X}:{b[4]:02X}{b[5]:02X}"
 
 
 def get_address_list(
     source_ip: Union["IPv4Address", "IPv6Address"],
-    addr_range: Optional[range],
+    addr_modifier: Optional[AddressModifier],
 ) -> List[Union["IPv4Address", "IPv6Address"]]:
-    if not addr_range:
+    if not addr_modifier:
         return [source_ip]
-    source_ip_list = []
-    for i in addr_range:
-        if isinstance(source_ip, IPv4Address):
-            splitter = "."
-            typing = IPv4Address
-        else:
-            splitter = ":"
-            typing = IPv6Address
+    if isinstance(source_ip, IPv4Address):
+        typing = IPv4Address
+        bit_length = 32
+    else:
+        typing = IPv6Address
+        bit_length = 128
+    # the modifier writes the masked bits of a 16 bit word at its byte offset of the address,
+    # a word reaching over the end of the address only keeps the bits inside the address
+    shift = bit_length - (addr_modifier.offset + 2) * 8
 
-        addr = str(source_ip).split(splitter)
-        addr[-1] = str(i)
-        addr_str = splitter.join(addr)
-        source_ip_list.append(typing(addr_str))
+    def place(value: int) -> int:
+        return value << shift if shift >= 0 else value >> -shift
 
-    return source_ip_list
+    mask = place(addr_modifier.mask & 0xFFFF) & ((1 << bit_length) - 1)
+    base_int = int(source_ip) & ~mask
+    return [typing(base_int | (place(i) & mask)) for i in addr_modifier.addr_range]
 
 
 async def get_address_learning_packet(
@@ -107,51 +124,79 @@ async def get_address_learning_packet(
         if not arp_refresh_data.source_ip or arp_refresh_data.source_ip.is_empty
         else arp_refresh_data.source_ip
     )
-    source_ip_list = get_address_list(source_ip, arp_refresh_data.addr_range)
-    packet_list = []
-    for source_ip in source_ip_list:
-        if port_struct.protocol_version.is_ipv4:
-            destination_ip = sender_ip if gateway.is_empty else gateway
-            packet = ARPPacket(
-                smac=smac,
-                source_ip=IPv4Address(source_ip),
-                destination_ip=IPv4Address(destination_ip),
-                dmac=dmac,
-            ).make_arp_packet()
-
-        else:
-            destination_ip = get_link_local_uci_ipv6address(dmac)
-            packet = NDPPacket(
-                smac=smac,
-                source_ip=IPv6Address(source_ip),
-                destination_ip=IPv6Address(destination_ip),
-                dmac=dmac,
-            ).make_ndp_packet()
-        packet_list.append(packet)
-    return packet_list
+    source_ip_list = get_address_list(source_ip, arp_refresh_data.addr_modifier)
+    if port_struct.protocol_version.is_ipv4:
+        destination_ip = sender_ip if gateway.is_empty else gateway
+        build = _build_arp_packets
+    else:
+        destination_ip = get_link_local_uci_ipv6address(dmac)
+        build = _build_ndp_packets
+    return build(smac, source_ip_list, destination_ip, dmac)
+
+
+def _build_arp_packets(
+    smac: "MacAddress",
+    source_ip_list: List[Union["IPv4Address", "IPv6Address"]],
+    destination_ip: Union["IPv4Address", "IPv6Address", str],
+    dmac: "MacAddress",
+) -> List[str]:
+    return ARPPacket(
+        smac=smac,
+        source_ip=IPv4Address(source_ip_list[0]),
+        destination_ip=IPv4Address(destination_ip),
+        dmac=dmac,
+    ).make_arp_packets(source_ip_list)
+
+
+def _build_ndp_packets(
+    smac: "MacAddress",
+    source_ip_list: List[Union["IPv4Address", "IPv6Address"]],
+    destination_ip: Union["IPv4Address", "IPv6Address", str],
+    dmac: "MacAddress",
+) -> List[str]:
+    ndp_destination_ip = IPv6Address(destination_ip)
+    return [
+        NDPPacket(
+            smac=smac,
+            source_ip=IPv6Address(source_ip),
+            destination_ip=ndp_destination_ip,
+            dmac=dmac,
+        ).make_ndp_packet()
+        for source_ip in source_ip_list
+    ]
+
+
+async def _setup_port_address_refresh(
+    port_struct: "PortStruct", use_gateway: bool
+) -> List[Tuple["misc.Token", bool]]:
+    packet_lists = await asyncio.gather(
+        *(
+            get_address_learning_packet(port_struct, arp_data, use_gateway)
+            for arp_data in port_struct.properties.address_refresh_data_set.values()
+        )
+    )
+    await port_struct.set_rx_tables()
+    is_rx_only = port_struct.port_conf.is_rx_only
+    return [
+        (port_struct.port_ins.tx_single_pkt.send.set(packet), is_rx_only)
+        for packet_list in packet_lists
+        for packet in packet_list
+    ]
 
 
 async def setup_address_refresh(
     resources: "ResourceManager",
 ) -> List[Tuple["misc.Token", bool]]:  # SetupAddressRefresh
-    address_refresh_tokens: List[Tuple["misc.Token", bool]] = []
-    for port_struct in resources.port_structs:
-        arp_data_set = port_struct.properties.address_refresh_data_set
-        for arp_data in arp_data_set:
-            packet_list = await get_address_learning_packet(
-                port_struct,
-                arp_data,
-                resources.test_conf.use_gateway_mac_as_dmac,
+    # ports are independent of each other, set them up concurrently and keep the port order
+    port_tokens = await asyncio.gather(
+        *(
+            _setup_port_address_refresh(
+                port_struct, resources.test_conf.use_gateway_mac_as_dmac
             )
-            for packet in packet_list:
-                address_refresh_tokens.append(
-                    (
-                        port_struct.port_ins.tx_single_pkt.send.set(packet),
-                        port_struct.port_conf.is_rx_only,
-                    )
-                )
-        await port_struct.set_rx_tables()
-    return address_refresh_tokens
+            for port_struct in resources.port_structs
+        )
+    )
+    return [token for tokens in port_tokens for token in tokens]
 
 
 async def setup_address_arp_refresh(
@@ -179,30 +224,51 @@ class AddressRefreshHandler:
         self.interval = 0.0  # unit: second
         self.refresh_period = refresh_period
         self.state = const.TestState.L3_LEARNING
+        # tokens only depend on the state, calculate batches of both states once
+        all_tokens = [refresh_token[0] for refresh_token in address_refresh_tokens]
+        rx_only_tokens = [
+            refresh_token[0]
+            for refresh_token in address_refresh_tokens
+            if refresh_token[1]
+        ]
+        self._batches: Dict["const.TestState", Tuple[List["misc.Token"], float, int]] = {
+            const.TestState.L3_LEARNING: (
+                all_tokens,
+                *self._calc_refresh_time_interval(all_tokens),
+            ),
+            const.TestState.RUNNING_TEST: (
+                rx_only_tokens,
+                *self._calc_refresh_time_interval(rx_only_tokens),
+            ),
+        }
 
     def get_batch(self) -> List["misc.Token"]:
-        packet_list = []
         if self.index >= len(self.tokens):
             self.index = 0
-        for _ in range(self.refresh_burst_size):
-            if self.index < len(self.tokens):
-                packet_list.append(self.tokens[self.index])
-                self.index += 1
-        return packet_list
+        start = self.index
+        self.index = min(start + self.refresh_burst_size, len(self.tokens))
+        return self.tokens[start : self.index]
 
     def _calc_refresh_time_interval(
         self, refresh_tokens: List["misc.Token"]
-    ) -> None:  # CalcRefreshTimerInternal
+    ) -> Tuple[float, int]:  # CalcRefreshTimerInternal
+        """ return refresh interval (unit: second) and burst size """
         total_refresh_count = len(refresh_tokens)
-        if total_refresh_count > 0:
-            self.refresh_burst_size = 1
-            interval = math.floor(self.refresh_period / total_refresh_count)
-            if interval < const.MIN_REFRESH_TIMER_INTERNAL:
-                self.refresh_burst_size = math.ceil(
-                    const.MIN_REFRESH_TIMER_INTERNAL / interval
-                )
-                interval = const.MIN_REFRESH_TIMER_INTERNAL
-            self.interval = interval / 1000.0  # ms -> second
+        if total_refresh_count == 0:
+            return self.interval, self.refresh_burst_size
+        refresh_burst_size = 1
+        refresh_period = int(self.refresh_period)
+        interval = refresh_period // total_refresh_count
+        if interval < const.MIN_REFRESH_TIMER_INTERNAL:
+            # size the burst from the total so every token is refreshed within the period,
+            # ceiling division, a zero period refreshes all tokens on every tick
+            refresh_burst_size = (
+                -(-const.MIN_REFRESH_TIMER_INTERNAL * total_refresh_count // refresh_period)
+                if refresh_period > 0
+                else total_refresh_count
+            )
+            interval = const.MIN_REFRESH_TIMER_INTERNAL
+        return interval / 1000.0, refresh_burst_size  # ms -> second
 
     def set_current_state(self, state: "const.TestState") -> "AddressRefreshHandler":
         """
@@ -211,17 +277,12 @@ class AddressRefreshHandler:
         2. Testcase running traffic
         """
         self.state = state
-        if self.state == const.TestState.L3_LEARNING:
-            self.tokens = [
-                refresh_token[0] for refresh_token in self.address_refresh_tokens
-            ]
-        else:
-            self.tokens = [
-                refresh_token[0]
-                for refresh_token in self.address_refresh_tokens
-                if refresh_token[1]
-            ]
-        self._calc_refresh_time_interval(self.tokens)
+        batch_state = (
+            state
+            if state == const.TestState.L3_LEARNING
+            else const.TestState.RUNNING_TEST
+        )
+        self.tokens, self.interval, self.refresh_burst_size = self._batches[batch_state]
         return self
 
 
@@ -231,7 +292,7 @@ async def generate_l3_learning_packets(
     address_refresh_handler: "AddressRefreshHandler",
 ) -> bool:
     tokens = address_refresh_handler.get_batch()
-    await utils.apply(*tokens)
+    await apply_in_batches(tokens)
 
     return not resources.test_running()
 
@@ -308,6 +369,18 @@ async def add_flow_based_learning_preamble_steps(
     await resources.set_frame_limit(0)  # clear packet limit
 
 
+def _make_mac_learning_packet(smac: "MacAddress") -> str:
+    """ broadcast frame from smac, ethertype FFFF, padded to 132 bytes """
+    return "".join(
+        (
+            BROADCAST_MAC,
+            smac.to_hexstring(),
+            MAC_LEARNING_ETHERTYPE,
+            MAC_LEARNING_PADDINGS,
+        )
+    )
+
+
 def make_mac_token(
     send_struct: "PortStruct", hex_data: str
 ) -> "misc.Token":
@@ -334,29 +407,23 @@ async def add_mac_learning_steps(
     mac_learning_frame_count = (
         resources.test_conf.mac_learning_frame_count
     )
-    none_mac = "FFFFFFFFFFFF"
-    four_f = "FFFF"
-    paddings = "00" * 118
-    tasks = []
-    done_struct = []
+    tokens = []
+    done_struct = set()
     for port_struct in resources.port_structs:
         for stream_struct in port_struct.stream_structs:
-            src_hex_data = f"{none_mac}{stream_struct._addr_coll.smac.to_hexstring()}{four_f}{paddings}"
             if port_struct.port_identity.name not in done_struct:
-                tokens = make_mac_token(
-                    port_struct, src_hex_data
-                )
-                tasks.append(tokens)
-                done_struct.append(port_struct.port_identity.name)
+                src_hex_data = _make_mac_learning_packet(stream_struct._addr_coll.smac)
+                tokens.append(make_mac_token(port_struct, src_hex_data))
+                done_struct.add(port_struct.port_identity.name)
             for dest_port_struct in stream_struct._rx_ports:
-                dest_hex_data = f"{none_mac}{stream_struct._addr_coll.dmac.to_hexstring()}{four_f}{paddings}"
                 if dest_port_struct.port_identity.name in done_struct:
                     continue
-                tokens = make_mac_token(
-                    dest_port_struct, dest_hex_data
-                )
-                done_struct.append(dest_port_struct.port_identity.name)
-                tasks.append(tokens)
+                dest_hex_data = _make_mac_learning_packet(stream_struct._addr_coll.dmac)
+                tokens.append(make_mac_token(dest_port_struct, dest_hex_data))
+                done_struct.add(dest_port_struct.port_identity.name)
+    if not tokens:
+        return
+    # one learning frame from every port per round, the rounds are paced by DELAY_LEARNING_MAC
     for _ in range(mac_learning_frame_count):
-        await asyncio.gather(*tasks)
+        await apply_in_batches(tokens)
         await asyncio.sleep(const.DELAY_LEARNING_MAC)
@@ -1,8 +1,10 @@
 import asyncio
 import math
-from typing import TYPE_CHECKING
+from typing import List, TYPE_CHECKING
+from .common import apply_in_batches
 
 if TYPE_CHECKING:
+    from xoa_driver import misc
     from .test_resource import ResourceManager
     from .structure import PortStruct
 
@@ -11,22 +13,23 @@ async def setup_source_port_rates(
     resources: "ResourceManager",
     current_packet_size: float,
 ) -> None:  # SetupSourcePortRatesForLearning
-    for port_struct in resources.tx_ports:
-        if resources.test_conf.is_stream_based:
-            await _setup_source_port_rate_stream_mode(
-                port_struct,
-                current_packet_size,
-            )
-        else:
-            await _setup_source_port_rate_modifier_mode(
-                port_struct,
-                current_packet_size,
-            )
+    # rates of the streams of a port are sent in batches, ports run concurrently
+    if resources.test_conf.is_stream_based:
+        setup_port_rate = _setup_source_port_rate_stream_mode
+    else:
+        setup_port_rate = _setup_source_port_rate_modifier_mode
+    await asyncio.gather(
+        *(
+            apply_in_batches(setup_port_rate(port_struct, current_packet_size))
+            for port_struct in resources.tx_ports
+        )
+    )
 
 
-async def _setup_source_port_rate_stream_mode(
+def _setup_source_port_rate_stream_mode(
     port_struct: "PortStruct", current_packet_size: float
-) -> None:  # SetupSourcePortRateStreamMode
+) -> List["misc.Token"]:  # SetupSourcePortRateStreamMode
+    tokens = []
     inter_frame_gap = port_struct.port_conf.inter_frame_gap
     src_port_speed = port_struct.send_port_speed
     for peer_struct in port_struct.properties.peers:
@@ -43,18 +46,17 @@ async def _setup_source_port_rate_stream_mode(
             * current_packet_size
             / (current_packet_size + inter_frame_gap)
         )
-        await asyncio.gather(
-            *[
-                stream_struct.set_l2bps_rate(stream_rate_bps_L2)
-                for stream_struct in stream_info_list
-            ]
+        tokens.extend(
+            stream_struct.set_l2bps_rate(stream_rate_bps_L2)
+            for stream_struct in stream_info_list
         )
+    return tokens
 
 
-async def _setup_source_port_rate_modifier_mode(
+def _setup_source_port_rate_modifier_mode(
     port_struct: "PortStruct",
     current_packet_size: float,
-) -> None:  # SetupSourcePortRateModifierMode
+) -> List["misc.Token"]:  # SetupSourcePortRateModifierMode
     inter_frame_gap = port_struct.port_conf.inter_frame_gap
     src_port_speed = port_struct.send_port_speed
     port_rate_bps_L1 = port_struct.rate_percent * src_port_speed / 100.0
@@ -71,9 +73,7 @@ async def _setup_source_port_rate_modifier_mode(
         stream_rate_list = [low_rate, high_rate]
     else:
         stream_rate_list = [math.floor(port_rate_bps_L2)]
-    await asyncio.gather(
-        *[
-            port_struct.stream_structs[stream_id].set_l2bps_rate(stream_rate)
-            for stream_id, stream_rate in enumerate(stream_rate_list)
-        ]
-    )
+    return [
+        port_struct.stream_structs[stream_id].set_l2bps_rate(stream_rate)
+        for stream_id, stream_rate in enumerate(stream_rate_list)
+    ]
@@ -37,8 +37,10 @@ async def setup_streams(
         else:
             add_standard_streams(port_structs, test_conf)
 
+    await asyncio.gather(
+        *(port_struct.configure_streams(test_conf) for port_struct in port_structs)
+    )
     for port_struct in port_structs:
-        await port_struct.configure_streams(test_conf)
         # set should stop on los before start traffic, can monitor sync status when traffic start
         port_struct.set_should_stop_on_los(test_conf.should_stop_on_los)
 
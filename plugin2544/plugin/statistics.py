@@ -42,7 +42,7 @@ class DelayCounter(AvgMinMax):
 
     def avg(self, count: int) -> None:
         for name, value in self:
-            setattr(self, name, math.floor(value / count))
+            setattr(self, name, value // count)
 
     def update(self, data: DelayData) -> None:
         if not data.is_valid:
@@ -55,7 +55,7 @@ class DelayCounter(AvgMinMax):
             self.minimum = min(data.minimum, self.minimum)
             self.maximum = max(data.maximum, self.maximum)
         self._count += 1
-        self.average = math.floor(self._total / self._count if self._count else 0)
+        self.average = self._total // self._count
 
 
 class StreamCounter(BaseModel):
@@ -255,14 +255,18 @@ class PortStatistic(BaseModel):
 
     def aggregate_tx_statistic(self, stream_statistic: "StreamStatisticData") -> None:
         """aggregate tx port statistic based on pt stream statistic"""
-        self.add_tx(stream_statistic.tx_counter)
-        self.add_burst_frames(stream_statistic.burst_frames)
-        self.add_burst_bytes_count(stream_statistic.rx_counter.bytes_count)
-        self.add_loss(
-            stream_statistic.tx_counter.frames,
-            stream_statistic.rx_counter.frames,
-            stream_statistic.live_loss_frames,
+        tx_counter = stream_statistic.tx_counter
+        rx_counter = stream_statistic.rx_counter
+        tx_counter.calculate_stream_rate(
+            self.is_final, self.duration, self.frame_size, self.interframe_gap
         )
+        self.tx_counter.add_stream_counter(tx_counter)
+        self.burst_frames += stream_statistic.burst_frames
+        self.burst_bytes_count += rx_counter.bytes_count
+        if self.is_final:
+            self.loss_frames += max(tx_counter.frames - rx_counter.frames, 0)
+        else:
+            self.loss_frames += max(stream_statistic.live_loss_frames, 0)
         self.stream_statistic.append(stream_statistic)
 
     def aggregate_rx_statistic(self, pr_statistic: "PRStatistic") -> None:
@@ -271,13 +275,6 @@ class PortStatistic(BaseModel):
         self.add_latency(pr_statistic.latency)
         self.add_jitter(pr_statistic.jitter)
 
-    def add_tx(self, tx_stream_counter: "StreamCounter") -> None:
-        """ add tx stream counter into port counter from pr_stream statistic """
-        tx_stream_counter.calculate_stream_rate(
-            self.is_final, self.duration, self.frame_size, self.interframe_gap
-        )
-        self.tx_counter.add_stream_counter(tx_stream_counter)
-
     def add_rx(self, rx_stream_counter: "StreamCounter") -> None:
         """ add rx stream counter into port counter from pr_stream statistic """
         rx_stream_counter.calculate_stream_rate(
@@ -293,18 +290,6 @@ class PortStatistic(BaseModel):
         """ add rx jitter counter into port counter from pr_stream statistic """
         self.jitter.update(delay_data)
 
-    def add_burst_frames(self, frame_count: int) -> None:
-        self.burst_frames += frame_count
-
-    def add_burst_bytes_count(self, bytes_count: int) -> None:
-        self.burst_bytes_count += bytes_count
-
-    def add_loss(self, tx_frames: int, rx_frames: int, live_loss_frames: int) -> None:
-        if self.is_final:
-            self.loss_frames += max(tx_frames - rx_frames, 0)
-        else:
-            self.loss_frames += max(live_loss_frames, 0)
-
     def calculate_rate(self) -> None:
         """ after collect data from stream, need to calculate rate"""
         self.loss_ratio = (
@@ -1,6 +1,6 @@
-import asyncio
 from copy import deepcopy
-from typing import List, Optional, TYPE_CHECKING
+from itertools import islice
+from typing import Any, Iterator, List, Optional, TYPE_CHECKING
 from xoa_driver import utils, enums, misc
 from ..model.m_protocol_segment import (
     HWModifier,
@@ -21,26 +21,32 @@ from .statistics import (
 )
 from ..utils.field import MacAddress, IPv4Address, IPv6Address
 from ..utils import constants as const, protocol_segments as ps, exceptions
-from collections import defaultdict
 from loguru import logger
 
 if TYPE_CHECKING:
+    from xoa_driver.lli import commands
     from .structure import PortStruct
     from .test_config import TestConfigData
 
 
 class PTStream:
+    # created for every stream, fixed attribute layout keeps them small and fast to access
+    __slots__ = ("tx_port", "stream_id", "statistic")
+
     def __init__(self, tx_port: "PortStruct", stream_id: int) -> None:
         self.tx_port = tx_port
         self.stream_id = stream_id
         self.statistic = StreamCounter()
 
-    async def query(self) -> None:
-        """ query statistic on TX port """
-        tx_frames = await self.tx_port.port_ins.statistics.tx.obtain_from_stream(
-            self.stream_id
-        ).get()
-        self.statistic = StreamCounter(
+    def query_tokens(self) -> List["misc.Token"]:
+        """ statistic query commands on TX port, results are handled by update """
+        return [self.tx_port.port_ins.statistics.tx.obtain_from_stream(self.stream_id).get()]
+
+    def update(self, results: Iterator[Any]) -> None:
+        """ consume the query_tokens results in order """
+        tx_frames: "commands.PT_STREAM.GetDataAttr" = next(results)
+        # tester counters are ints already, skip the validation on every poll
+        self.statistic = StreamCounter.construct(
             frames=tx_frames.packet_count_since_cleared,
             bps=tx_frames.bit_count_last_sec,
             pps=tx_frames.packet_count_last_sec,
@@ -48,6 +54,8 @@ class PTStream:
 
 
 class PRStream:
+    __slots__ = ("tx_port", "tpld_id", "rx_port", "statistic")
+
     def __init__(
         self, tx_port: "PortStruct", rx_port: "PortStruct", tpld_id: int
     ) -> None:
@@ -56,17 +64,27 @@ class PRStream:
         self.rx_port = rx_port
         self.statistic: "PRStatistic" = PRStatistic()
 
-    async def query(self) -> None:
-        """ query statistic on rx port """
+    def query_tokens(self) -> List["misc.Token"]:
+        """ statistic query commands on rx port, results are handled by update """
         rx = self.rx_port.port_ins.statistics.rx.access_tpld(self.tpld_id)
-        rx_frames, error, ji, latency = await utils.apply(
+        return [
             rx.traffic.get(),
             rx.errors.get(),
             rx.jitter.get(),
             rx.latency.get(),
-        )
-        self.statistic = PRStatistic(
-            rx_stream_counter=StreamCounter(
+        ]
+
+    def update(self, results: Iterator[Any]) -> None:
+        """ consume the query_tokens results in order """
+        rx_frames: "commands.PR_TPLDTRAFFIC.GetDataAttr"
+        error: "commands.PR_TPLDERRORS.GetDataAttr"
+        ji: "commands.PR_TPLDJITTER.GetDataAttr"
+        latency: "commands.PR_TPLDLATENCY.GetDataAttr"
+        rx_frames, error, ji, latency = islice(results, 4)
+        # tester counters are ints already, skip the validation on every poll,
+        # DelayData still validates to detect the invalid counter values
+        self.statistic = PRStatistic.construct(
+            rx_stream_counter=StreamCounter.construct(
                 frames=rx_frames.packet_count_since_cleared,
                 bps=rx_frames.bit_count_last_sec,
                 pps=rx_frames.packet_count_last_sec,
@@ -89,6 +107,26 @@ class PRStream:
 
 
 class StreamStruct:
+    __slots__ = (
+        "_tx_port",
+        "_rx_ports",
+        "_stream_id",
+        "_tpldid",
+        "_arp_mac",
+        "__is_stream_based",
+        "_hw_modifiers",
+        "_addr_coll",
+        "_packet_header",
+        "_header_hex",
+        "_stream_offset",
+        "_packet_limit",
+        "_stream_statistic",
+        "_best_result",
+        "_pt_stream",
+        "_pr_streams",
+        "_stream",
+    )
+
     def __init__(
         self,
         tx_port: "PortStruct",
@@ -104,8 +142,10 @@ class StreamStruct:
         self._tpldid: int = tpldid
         self._arp_mac: MacAddress = arp_mac
         self.__is_stream_based: bool = True
+        self._hw_modifiers: List["HWModifier"] = []
         self._addr_coll: AddressCollection = AddressCollection()
-        self._packet_header: bytearray = bytearray()
+        self._packet_header: bytes = bytes()
+        self._header_hex: str = ""
         self._stream_offset = stream_offset
         self._packet_limit: int = 0
         self._stream_statistic: StreamStatisticData = (
@@ -114,6 +154,9 @@ class StreamStruct:
         self._best_result: Optional[
             StreamStatisticData
         ] = None  # store best result for throughput per_port_result_scope, only for stream based
+        # query helpers only depend on the ports and ids, each query replaces their statistic
+        self._pt_stream = PTStream(tx_port, stream_id)
+        self._pr_streams = tuple(PRStream(tx_port, port, tpldid) for port in rx_ports)
 
     def is_rx_port(self, peer_struct: "PortStruct"):
         return True if peer_struct in self._rx_ports else False
@@ -127,6 +170,9 @@ class StreamStruct:
 
     @property
     def hw_modifiers(self) -> List["HWModifier"]:
+        return self._hw_modifiers
+
+    def _compute_hw_modifiers(self) -> List["HWModifier"]:
         if self.__is_stream_based:
             return [
                 modifier
@@ -160,7 +206,11 @@ class StreamStruct:
         if self._best_result:
             self._best_result.calculate(self._tx_port, self.rx_port)
 
-    async def configure(self, test_conf: "TestConfigData") -> None:
+    async def create(self, test_conf: "TestConfigData") -> None:
+        """
+        create the stream and build its packet header, streams of a port have to be created one by one
+        since the stream index is allocated on creation and the header consumes the value ranges in order
+        """
         stream = await self._tx_port.create_stream()
         self._stream = stream
         base_mac = (
@@ -169,6 +219,8 @@ class StreamStruct:
             else test_conf.mac_base_address
         )
         self.__is_stream_based = test_conf.is_stream_based
+        # modifiers only depend on the profile and flow creation type, compute them once
+        self._hw_modifiers = self._compute_hw_modifiers()
         self._addr_coll = get_address_collection(
             self._tx_port,
             self.rx_port,
@@ -176,21 +228,25 @@ class StreamStruct:
             self._arp_mac,
             self._stream_offset,
         )
+        self.build_packet_header()
+
+    async def configure(self, test_conf: "TestConfigData") -> None:
+        """ configure the created stream, independent of the other streams """
+        # the modifier count has to be known before the modifiers can be addressed,
+        # everything else of the stream is configured in one batch
+        modifier_tokens = await self.setup_modifier()
         await utils.apply(
             self._stream.enable.set(enums.OnOffWithSuppress.ON),
             self._stream.comment.set(f"Stream {self._stream_id} / {self._tpldid}"),
             self._stream.packet.header.protocol.set(
                 self._tx_port.port_conf.profile.segment_id_list
             ),
-            self._stream.payload.content.set(
-                test_conf.payload_type.to_xmp(),
-                misc.Hex(test_conf.payload_pattern), 
-            ),
+            self._stream.payload.content.set(*test_conf.payload_content),
             self._stream.tpld_id.set(test_payload_identifier=self._tpldid),
             self._stream.insert_packets_checksum.set(enums.OnOff.ON),
+            self.set_packet_header(),
+            *modifier_tokens,
         )
-        await self.set_packet_header()
-        await self.setup_modifier()
         self.init_rx_tables(
             test_conf.arp_refresh_enabled,
             test_conf.use_gateway_mac_as_dmac,
@@ -225,23 +281,24 @@ class StreamStruct:
                 None,
             )
 
-    async def query(self) -> None:
+    def query_tokens(self) -> List["misc.Token"]:
+        """ TX and RX statistic query commands of this stream, results are handled by update """
+        return [
+            token
+            for stream in (self._pt_stream, *self._pr_streams)
+            for token in stream.query_tokens()
+        ]
+
+    def update(self, results: Iterator[Any]) -> None:
         """
-        aggregate pr_stream data into _stream_statistic
+        consume the query_tokens results in order, aggregate pr_stream data into _stream_statistic
         pt_stream statistic should calculate in TX Port
         pr_stream statistic should calculate in RX port
         """
-        pr_streams = [
-            PRStream(self._tx_port, port, self._tpldid) for port in self._rx_ports
-        ]
-        pt_stream = PTStream(self._tx_port, self._stream_id)
-        await asyncio.gather(
-            pt_stream.query(), *[pr_stream.query() for pr_stream in pr_streams]
-        )
         src_addr, dst_addr = self._addr_coll.get_addr_pair_by_protocol(
             self._tx_port.protocol_version
         )
-        self._stream_statistic = StreamStatisticData(
+        stream_statistic = self._stream_statistic = StreamStatisticData(
             src_port_id=self._tx_port.port_identity.name,
             dest_port_id=self.rx_port.port_identity.name,
             src_port_addr=str(src_addr),
@@ -250,20 +307,35 @@ class StreamStruct:
         )
 
         # polling TX and RX statistic not at the same time, may cause the rx statistic larger than tx statistic
-        self._stream_statistic.tx_counter.add_stream_counter(pt_stream.statistic)
-        for pr_stream in pr_streams:
+        pt_stream = self._pt_stream
+        pt_stream.update(results)
+        stream_statistic.tx_counter.add_stream_counter(pt_stream.statistic)
+        for pr_stream in self._pr_streams:
+            pr_stream.update(results)
             # aggregate data on rx port statistic based on pr_stream
-            self._stream_statistic.add_pr_stream_statistic(pr_stream.statistic)
-            async with pr_stream.rx_port.lock:
-                pr_stream.rx_port.statistic.aggregate_rx_statistic(pr_stream.statistic)
-        async with self._tx_port.lock:
-            # aggregate data on tx port statistic based on pt_stream
-            self._tx_port.statistic.aggregate_tx_statistic(self._stream_statistic)
-
-    async def set_packet_header(self) -> None:
+            stream_statistic.add_pr_stream_statistic(pr_stream.statistic)
+            pr_stream.rx_port.statistic.aggregate_rx_statistic(pr_stream.statistic)
+        # aggregate data on tx port statistic based on pt_stream
+        self._tx_port.statistic.aggregate_tx_statistic(stream_statistic)
+
+    def build_packet_header(self) -> None:
+        """
+        build packet header based on segment
+        """
+        template = self._tx_port.header_template
+        if template.is_usable:
+            self._packet_header, self._header_hex = template.build(self._addr_coll)
+        else:
+            self._packet_header = self._prepare_packet_header()
+            self._header_hex = self._packet_header.hex()
+
+    def set_packet_header(self) -> "misc.Token":
         """
-        get packet header based on segment
+        return the command setting the built packet header on the stream
         """
+        return self._stream.packet.header.data.set(self._header_hex)    # type: ignore
+
+    def _prepare_packet_header(self) -> bytearray:
         # Insert all configured header segments in order
         profile = self._tx_port.port_conf.profile.copy(deep=True)
         for index, segment in enumerate(profile.segments):
@@ -295,39 +367,49 @@ class StreamStruct:
                     self._addr_coll.dst_addr,
                 )
 
-        self._packet_header = profile.prepare()
-        await self._stream.packet.header.data.set(self._packet_header.hex())    # type: ignore
+        return profile.prepare()
 
-    async def setup_modifier(self) -> None:
+    async def setup_modifier(self) -> List["misc.Token"]:
+        """
+        configure the modifier count, return the commands setting up each modifier
+        """
         modifiers = self._stream.packet.header.modifiers
-        await modifiers.configure(len(self.hw_modifiers))
-        for mid, hw_modifier in enumerate(self.hw_modifiers):
+        hw_modifiers = self._hw_modifiers
+        await modifiers.configure(len(hw_modifiers))
+        tokens = []
+        for mid, hw_modifier in enumerate(hw_modifiers):
             modifier = modifiers.obtain(mid)
-            await modifier.specification.set(
-                position=hw_modifier.byte_segment_position,
-                mask=misc.Hex(f"{hw_modifier.mask}"),    
-                action=hw_modifier.action.to_xmp(),
-                repetition=hw_modifier.repeat,
+            tokens.append(
+                modifier.specification.set(
+                    position=hw_modifier.byte_segment_position,
+                    mask=misc.Hex(hw_modifier.mask),
+                    action=hw_modifier.action.to_xmp(),
+                    repetition=hw_modifier.repeat,
+                )
             )
-            await modifier.range.set(
-                min_val=hw_modifier.start_value,
-                step=hw_modifier.step_value,
-                max_val=hw_modifier.stop_value,
+            tokens.append(
+                modifier.range.set(
+                    min_val=hw_modifier.start_value,
+                    step=hw_modifier.step_value,
+                    max_val=hw_modifier.stop_value,
+                )
             )
+        return tokens
 
-    async def set_packet_size(
+    # the stream settings return their commands, callers send the settings of all streams in one batch
+    def set_packet_size(
         self, packet_size_type: enums.LengthType, min_size: int, max_size: int
-    ) -> None:
-        await self._stream.packet.length.set(packet_size_type, min_size, max_size)
+    ) -> "misc.Token":
+        return self._stream.packet.length.set(packet_size_type, min_size, max_size)
 
-    async def set_l2bps_rate(self, rate: int) -> None:
-        await self._stream.rate.l2bps.set(rate)
+    def set_l2bps_rate(self, rate: int) -> "misc.Token":
+        return self._stream.rate.l2bps.set(rate)
 
-    async def set_frame_limit(self, frame_count: int) -> None:
+    def set_frame_limit(self, frame_count: int) -> "misc.Token":
         self._packet_limit = frame_count
         if frame_count > const.MAX_PACKET_LIMIT_VALUE:
             raise exceptions.PacketLimitOverflow(frame_count)
-        await self._stream.packet.limit.set(frame_count)
+        return self._stream.packet.limit.set(frame_count)
 
 
 def get_address_collection(
@@ -337,22 +419,20 @@ def get_address_collection(
     arp_mac: MacAddress,
     stream_offset: Optional[StreamOffset] = None,
 ) -> "AddressCollection":
-    default_none = defaultdict(None)
-    if (
-        port_struct.port_conf.ip_address is None
-        or peer_struct.port_conf.ip_address is None
-    ):
-        src_network = dst_network = default_none
+    src_ip_address = port_struct.port_conf.ip_address
+    dst_ip_address = peer_struct.port_conf.ip_address
+    if src_ip_address is None or dst_ip_address is None:
+        src_network = dst_network = None
         src_addr = dst_addr = None
         cls_src = cls_dst = None
     else:
-        src_network = port_struct.port_conf.ip_address.network
-        dst_network = peer_struct.port_conf.ip_address.network
-        cls_src = port_struct.port_conf.ip_address.address.__class__
-        cls_dst = peer_struct.port_conf.ip_address.address.__class__
+        src_network = src_ip_address.network
+        dst_network = dst_ip_address.network
+        cls_src = src_ip_address.address.__class__
+        cls_dst = dst_ip_address.address.__class__
         # TODO: Need to compare src and dst class?
-        src_addr = port_struct.port_conf.ip_address.address
-        dst_addr = peer_struct.port_conf.ip_address.dst_addr
+        src_addr = src_ip_address.address
+        dst_addr = dst_ip_address.dst_addr
     if stream_offset:
         return AddressCollection(
             arp_mac=arp_mac,
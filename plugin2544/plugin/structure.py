@@ -1,9 +1,10 @@
 import asyncio
-from typing import List, TYPE_CHECKING, Optional, Set, Tuple, Union
+from typing import Any, Dict, Iterator, List, TYPE_CHECKING, Optional, Set, Tuple, Union
 from dataclasses import dataclass, field
 from xoa_driver import enums, misc, utils as driver_utils
 from .common import gen_macaddress
 from .data_model import (
+    AddressModifier,
     ArpRefreshData,
     RXTableData,
     StreamOffset,
@@ -11,7 +12,9 @@ from .data_model import (
 from .statistics import PortStatistic
 from .stream_struct import StreamStruct
 from ..utils import exceptions, constants as const
+from ..utils.coalesce import coalesce
 from ..utils.field import MacAddress, IPv4Address, IPv6Address
+from ..utils.protocol_segments import PacketHeaderTemplate
 from loguru import logger
 if TYPE_CHECKING:
     from xoa_core.core.test_suites.datasets import PortIdentity
@@ -45,9 +48,9 @@ class PortStruct:
         self._should_stop_on_los = False
         self._port_conf = port_conf
         self.properties = Properties()
-        self.lock = asyncio.Lock()
         self._stream_structs: List["StreamStruct"] = []
         self._statistic = PortStatistic()  # reset every second
+        self._header_template: Optional[PacketHeaderTemplate] = None
         self.stop = False
 
     def set_should_stop_on_los(self, value: bool) -> None:
@@ -61,6 +64,13 @@ class PortStruct:
     def capabilities(self) -> "commands.P_CAPABILITIES.GetDataAttr":
         return self.port_ins.info.capabilities
 
+    @property
+    def header_template(self) -> PacketHeaderTemplate:
+        """ packet header template of the port profile, shared by all streams of the port """
+        if self._header_template is None:
+            self._header_template = PacketHeaderTemplate(self._port_conf.profile)
+        return self._header_template
+
     async def _change_sync_status(
         self,
         port: "xoa_ports.GenericL23Port",
@@ -72,6 +82,7 @@ class PortStruct:
         """
         before = self.properties.sync_status
         after = self.properties.sync_status = bool(get_attr.sync_status)
+        self.properties.update_sync_event()
         # logger.debug(f'{self._should_stop_on_los} - {before} - {after}')
         if after or before == after:
             return
@@ -244,6 +255,7 @@ class PortStruct:
         self.port_ins.on_speed_change(self._change_physical_port_speed)
         self._tester.on_disconnected(self.__on_disconnect_tester)
         self.properties.sync_status = bool(sync.sync_status)
+        self.properties.update_sync_event()
         self.properties.traffic_status = bool(traffic.on_off)
         self.properties.native_mac_address = MacAddress(mac.mac_address)
         self.properties.physical_port_speed = port_speed.port_speed * 1e6
@@ -255,7 +267,7 @@ class PortStruct:
         )
 
     async def set_tx_time_limit(self, tx_timelimit: int) -> None:
-        await self.port_ins.tx_config.time_limit.set(int(tx_timelimit))
+        await self.port_ins.tx_config.time_limit.set(tx_timelimit)
 
     async def set_gap_monitor(
         self, gap_monitor_start_microsec: int, gap_monitor_stop_frames: int
@@ -355,6 +367,7 @@ class PortStruct:
     async def create_stream(self):
         return await self.port_ins.streams.create()
 
+    @coalesce
     async def get_traffic_status(self) -> bool:
         return bool((await self.port_ins.traffic.state.get()).on_off)
 
@@ -422,19 +435,21 @@ class PortStruct:
             for field_value_range in header_segment.value_ranges:
                 if field_value_range.restart_for_each_port:
                     field_value_range.reset()
+        # stream index and value ranges are allocated in stream order, only the rest of configure runs concurrently
         for stream_struct in self._stream_structs:
-            await stream_struct.configure(test_conf)
-
-    async def set_streams_packet_size(
-        self, packet_size_type: "enums.LengthType", min_size: int, max_size: int
-    ) -> None:
+            await stream_struct.create(test_conf)
         await asyncio.gather(
-            *[
-                stream_struct.set_packet_size(packet_size_type, min_size, max_size)
-                for stream_struct in self._stream_structs
-            ]
+            *(stream_struct.configure(test_conf) for stream_struct in self._stream_structs)
         )
 
+    def set_streams_packet_size(
+        self, packet_size_type: "enums.LengthType", min_size: int, max_size: int
+    ) -> List["misc.Token"]:
+        return [
+            stream_struct.set_packet_size(packet_size_type, min_size, max_size)
+            for stream_struct in self._stream_structs
+        ]
+
     async def setup_port(
         self, test_conf: "TestConfigData", latency_mode: "const.LatencyModeStr"
     ) -> None:
@@ -486,18 +501,27 @@ class PortStruct:
         )
         return self.send_port_speed
 
-    async def query(self) -> None:
-        """ read port statistics """
-        extra = self.port_ins.statistics.rx.extra.get()
-        stream_tasks = [stream_struct.query() for stream_struct in self.stream_structs]
-        extra_tasks = [extra] if self.port_conf.is_rx_port else []
-        results = await asyncio.gather(*extra_tasks, *stream_tasks)
+    def query_tokens(self) -> List["misc.Token"]:
+        """ statistic query commands of the port and its streams, results are handled by update """
+        tokens = [
+            token
+            for stream_struct in self.stream_structs
+            for token in stream_struct.query_tokens()
+        ]
+        if self.port_conf.is_rx_port:
+            tokens.insert(0, self.port_ins.statistics.rx.extra.get())
+        return tokens
+
+    def update(self, results: Iterator[Any]) -> None:
+        """ consume the query_tokens results in order """
         if self.port_conf.is_rx_port:
             # Only the RX port need to read gap data. Gap Monitor is set on the RX port
-            extra_r: commands.PR_EXTRA.GetDataAttr = results[0]
+            extra_r: commands.PR_EXTRA.GetDataAttr = next(results)
             self._statistic.fcs_error_frames = extra_r.fcs_error_count
             self._statistic.gap_duration = extra_r.gap_duration
             self._statistic.gap_count = extra_r.gap_count
+        for stream_struct in self.stream_structs:
+            stream_struct.update(results)
 
 
 TypeConf = Union["ThroughputTest", "LatencyTest", "FrameLossRateTest", "BackToBackTest"]
@@ -512,10 +536,18 @@ class Properties:
     low_dest_port_count: int = 0
     lowest_dest_port_index: int = -1
     highest_dest_port_index: int = -1
-    address_refresh_data_set: Set[ArpRefreshData] = field(default_factory=set)
+    # keyed by (source_ip, source_mac), the address modifier only depends on the port
+    address_refresh_data_set: Dict[
+        Tuple[Union[IPv4Address, IPv6Address, None], Optional[MacAddress]],
+        ArpRefreshData,
+    ] = field(default_factory=dict)
     peers: List["PortStruct"] = field(default_factory=list)
     arp_trunks: Set[RXTableData] = field(default_factory=set)
     ndp_trunks: Set[RXTableData] = field(default_factory=set)
+    arp_cache: Dict[Union[IPv4Address, IPv6Address], MacAddress] = field(default_factory=dict)
+    # destination ip modifier of the profile, resolved once per port
+    dest_ip_addr_modifier: Optional[AddressModifier] = None
+    dest_ip_addr_modifier_resolved: bool = False
 
     rate_percent: float = 0.0
     send_port_speed: float = 0.0
@@ -523,8 +555,19 @@ class Properties:
     arp_mac_address: MacAddress = MacAddress()
     traffic_status: bool = False
     sync_status: bool = True
+    sync_event: asyncio.Event = field(default_factory=asyncio.Event)
     physical_port_speed: float = 0.0
 
+    def __post_init__(self) -> None:
+        self.update_sync_event()
+
+    def update_sync_event(self) -> None:
+        """ keep sync_event in line with sync_status, so waiters wake up as soon as port is in sync """
+        if self.sync_status:
+            self.sync_event.set()
+        else:
+            self.sync_event.clear()
+
     def get_modifier_range(self, stream_id: int) -> Tuple[int, int]:
         """ calculate modifier range by test_port_index. """
         if stream_id == 0:
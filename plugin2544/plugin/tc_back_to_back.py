@@ -1,8 +1,7 @@
 from .structure import PortStruct
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from .test_type_config import BackToBackConfig
 from loguru import logger
-from decimal import Decimal
 from .statistics import FinalStatistic
 
 class BackToBackBoutEntry:
@@ -25,6 +24,8 @@ class BackToBackBoutEntry:
         self._port_test_passed: bool = False
         self._port_struct.clear_counter()
         self._is_less_than_resolution = False
+        # config lookup goes through several property levels, it does not change during the search
+        self._resolution: float = self._test_type_conf.burst_resolution
 
     @property
     def port_should_continue(self) -> bool:
@@ -71,7 +72,7 @@ class BackToBackBoutEntry:
         self._last_move = 1
 
     def compare_search_pointer(self) -> bool:
-        res = self._test_type_conf.burst_resolution
+        res = self._resolution
         # logger.debug(f"{self.next} - {self.current}")
         self._is_less_than_resolution = abs(self.next - self.current) <= res
         if not self._is_less_than_resolution:    
@@ -92,7 +93,7 @@ class BackToBackBoutEntry:
 
 def get_initial_back_to_back_boundaries(
     back_to_back_conf: "BackToBackConfig",
-    port_structs: List[PortStruct],
+    port_structs: Sequence[PortStruct],
     current_packet_size: float,
     rate_percent: float,
 ) -> List["BackToBackBoutEntry"]:
@@ -1,8 +1,8 @@
 import asyncio
-import time
 from copy import deepcopy
 import math
 from typing import List, Optional, Generator, TYPE_CHECKING, Tuple
+from .common import apply_in_batches
 from .learning import (
     AddressRefreshHandler,
     add_L2L3_learning_preamble_steps,
@@ -28,6 +28,7 @@ from .test_type_config import (
 from loguru import logger
 
 if TYPE_CHECKING:
+    from xoa_driver import misc
     from .test_resource import ResourceManager
     from .test_config import TestConfigData
     from ..utils.interfaces import TestSuitePipe, PStateConditions
@@ -148,13 +149,13 @@ class TestCaseProcessor:
         await schedule_arp_refresh(self.resources, self.address_refresh_handler)
 
     async def collect(self, params: "StatisticParams") -> "FinalStatistic":
-        start_time = time.time()
+        deadline_ns = self.resources.get_deadline_ns(params.duration)
         each_query_fail = False
         final_fail = False
         while True:
             # handle live statistic per second
             data = await aggregate_data(self.resources, params, is_final=False)
-            t = self.resources.should_quit(start_time, params.duration)
+            t = self.resources.should_quit(deadline_ns)
             should_quit, each_query_fail = t
             if each_query_fail:
                 final_fail = True
@@ -430,7 +431,9 @@ class TestCaseProcessor:
     async def _setup_packet_limit(
         self, boundaries: List["BackToBackBoutEntry"]
     ) -> None:
-        for _, port_struct in enumerate(self.resources.port_structs):
+        port_tokens: List[List["misc.Token"]] = []
+        for port_struct in self.resources.port_structs:
+            tokens: List["misc.Token"] = []
             for peer_struct in port_struct.properties.peers:
                 stream_info_list = [
                     stream_info
@@ -442,12 +445,13 @@ class TestCaseProcessor:
                 )
                 total_frame_count = boundaries[0].current
                 stream_burst = total_frame_count / port_stream_count
-                await asyncio.gather(
-                    *[
-                        stream_struct.set_frame_limit(math.floor(stream_burst))
-                        for stream_struct in stream_info_list
-                    ]
+                tokens.extend(
+                    stream_struct.set_frame_limit(math.floor(stream_burst))
+                    for stream_struct in stream_info_list
                 )
+            port_tokens.append(tokens)
+        # frame limits of the streams of a port are sent in batches, ports run concurrently
+        await asyncio.gather(*(apply_in_batches(tokens) for tokens in port_tokens))
 
 def check_if_frame_loss_success(
     frame_loss_conf: "FrameLossConfig", result: "FinalStatistic"
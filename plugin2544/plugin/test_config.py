@@ -1,13 +1,23 @@
-from typing import List, Tuple
+from typing import List, Tuple, TYPE_CHECKING
+from xoa_driver import misc
 from ..model import m_test_config as t_model
 from ..utils import constants as const, exceptions
 
+if TYPE_CHECKING:
+    from xoa_driver import enums
+
 
 class TestConfigData:
     """Get TestConfig Data without nested"""
 
     def __init__(self, test_config: "t_model.TestConfigModel"):
         self.__test_conf = test_config
+        # same payload for every stream, convert it once for the stream payload command
+        frame_size_config = test_config.frame_size_config
+        self.__payload_content = (
+            frame_size_config.payload_type.to_xmp(),
+            misc.Hex(frame_size_config.payload_pattern),
+        )
 
     @property
     def is_stream_based(self) -> bool:
@@ -101,6 +111,11 @@ class TestConfigData:
     def payload_pattern(self) -> str:
         return self.__test_conf.frame_size_config.payload_pattern
 
+    @property
+    def payload_content(self) -> Tuple["enums.PayloadType", "misc.Hex"]:
+        """ payload type and pattern as arguments of the stream payload command """
+        return self.__payload_content
+
     @property
     def multi_stream_config(self) -> "t_model.MultiStreamConfig":
         return self.__test_conf.multi_stream_config
@@ -1,11 +1,12 @@
 from __future__ import annotations
 import asyncio
 import time
+from collections import defaultdict
 from typing import TYPE_CHECKING, Union, Tuple
-from xoa_driver import testers as xoa_testers, modules, enums, utils
+from xoa_driver import testers as xoa_testers, modules, enums
 from .learning import add_mac_learning_steps
 from .config_checkers import check_config
-from .common import get_peers_for_source
+from .common import apply_in_batches, get_peers_for_source
 from .setup_streams import setup_streams
 from .structure import PortStruct
 
@@ -35,7 +36,14 @@ class ResourceManager:
         self.port_structs: list["PortStruct"] = []
         self.xoa_out: "TestSuitePipe" = xoa_out
         self.__test_conf: "TestConfigData" = test_conf
-        self.mapping: dict[str, list[int]] = {}
+        self._should_stop_on_los: bool = test_conf.should_stop_on_los
+        self.mapping: defaultdict[str, list[int]] = defaultdict(list)
+        # port relations never change after collect_control_ports, cache them for the polling loops
+        self._tx_ports: tuple["PortStruct", ...] = ()
+        self._rx_ports: tuple["PortStruct", ...] = ()
+        self._has_l3: bool = any(
+            conf.profile.protocol_version.is_l3 for conf in self.all_confs
+        )
 
     @property
     def test_conf(self):
@@ -43,7 +51,7 @@ class ResourceManager:
 
     @property
     def has_l3(self) -> bool:
-        return any(conf.profile.protocol_version.is_l3 for conf in self.all_confs)
+        return self._has_l3
 
     @staticmethod
     def _validate_tester_type(testers, valid_type) -> None:
@@ -51,41 +59,41 @@ class ResourceManager:
             raise ValueError("")
 
     @property
-    def tx_ports(self) -> list["PortStruct"]:
-        return [
-            port_struct
-            for port_struct in self.port_structs
-            if port_struct.port_conf.is_tx_port
-        ]
+    def tx_ports(self) -> tuple["PortStruct", ...]:
+        return self._tx_ports
 
     @property
-    def rx_ports(self) -> list["PortStruct"]:
-        return [
-            port_struct
-            for port_struct in self.port_structs
-            if port_struct.port_conf.is_rx_port
-        ]
+    def rx_ports(self) -> tuple["PortStruct", ...]:
+        return self._rx_ports
 
     async def setup_ports(self, latency_mode: "const.LatencyModeStr") -> None:
+        """ run the per-port setup pipeline of all ports in one gather """
         await asyncio.gather(
-            *[
-                port_struct.setup_port(self.__test_conf, latency_mode)
-                for port_struct in self.port_structs
-            ]
+            *(
+                self._setup_port_pipeline(port_struct, index, latency_mode)
+                for index, port_struct in enumerate(self.port_structs)
+            )
         )
 
+    async def _setup_port_pipeline(
+        self,
+        port_struct: "PortStruct",
+        index: int,
+        latency_mode: "const.LatencyModeStr",
+    ) -> None:
+        """ steps only need to be ordered within the same port """
+        await port_struct.setup_port(self.__test_conf, latency_mode)
+        await self.setup_sweep_reduction(port_struct, index)
+
     async def free(self) -> None:
-        await asyncio.gather(*[port_struct.free(stop_test=True) for port_struct in self.port_structs])
+        await asyncio.gather(*(port_struct.free(stop_test=True) for port_struct in self.port_structs))
 
     def build_map(self) -> None:
         for port_struct in self.tx_ports:
-            tester_id = port_struct.port_identity.tester_id
-            if tester_id not in self.mapping:
-                self.mapping[tester_id] = []
-            self.mapping[tester_id] += [
-                port_struct.port_identity.module_index,
-                port_struct.port_identity.port_index,
-            ]
+            port_identity = port_struct.port_identity
+            self.mapping[port_identity.tester_id].extend(
+                (port_identity.module_index, port_identity.port_index)
+            )
 
     async def init_resource(self, latency_mode: "const.LatencyModeStr") -> None:
         await self.collect_control_ports()
@@ -95,37 +103,31 @@ class ResourceManager:
         await self.stop_traffic()
         await asyncio.sleep(self.__test_conf.delay_after_port_reset_second) # delay after reset
         await self.setup_ports(latency_mode)
-        await self.setup_sweep_reduction()
         await self.add_toggle_port_sync_state_steps()
         await setup_streams(self.port_structs, self.__test_conf)
         await add_mac_learning_steps(self, const.MACLearningMode.ONCE)
 
     async def stop_traffic(self) -> None:
-        await utils.apply(
-            *[
+        await apply_in_batches(
+            [
                 port_struct.set_traffic(enums.StartOrStop.STOP)
                 for port_struct in self.port_structs
             ]
         )
         await asyncio.sleep(const.DELAY_STOPPED_TRAFFIC)
 
-    async def setup_sweep_reduction(self) -> None:
+    async def setup_sweep_reduction(self, port_struct: "PortStruct", index: int) -> None:
         if (
             not self.__test_conf.enable_speed_reduction_sweep
             or self.__test_conf.is_pair_topology
         ):
             return
-        await asyncio.gather(
-            *[
-                port.set_sweep_reduction(10 * (i + 1))
-                for i, port in enumerate(self.port_structs)
-            ]
-        )
+        await port_struct.set_sweep_reduction(10 * (index + 1))
 
     async def collect_control_ports(self) -> None:
+        # modules and ports are known once testers are connected, obtain() is a local lookup
         await asyncio.gather(*self.__testers.values())
-        for index, port_conf in enumerate(self.all_confs):
-            port_identity = self.__port_identities[index]
+        for port_conf, port_identity in zip(self.all_confs, self.__port_identities):
             tester = self.__testers[port_identity.tester_id]
             if not isinstance(tester, xoa_testers.L23Tester):
                 raise exceptions.WrongModuleTypeError(tester)
@@ -137,8 +139,18 @@ class ResourceManager:
                 tester, port, port_conf, port_identity, self.xoa_out
             )
             self.port_structs.append(port_struct)
+        self._tx_ports = tuple(
+            port_struct
+            for port_struct in self.port_structs
+            if port_struct.port_conf.is_tx_port
+        )
+        self._rx_ports = tuple(
+            port_struct
+            for port_struct in self.port_structs
+            if port_struct.port_conf.is_rx_port
+        )
         await asyncio.gather(
-            *[port_struct.prepare() for port_struct in self.port_structs]
+            *(port_struct.prepare() for port_struct in self.port_structs)
         )
 
     async def add_toggle_port_sync_state_steps(self) -> None:
@@ -147,27 +159,38 @@ class ResourceManager:
         if not self.__test_conf.toggle_port_sync:
             return
         await asyncio.gather(
-            *[
+            *(
                 port_struct.set_toggle_port_sync(enums.OnOff.OFF)
                 for port_struct in self.port_structs
-            ]
+            )
         )
         await asyncio.sleep(self.__test_conf.sync_off_duration_second)
         await asyncio.gather(
-            *[
+            *(
                 port_struct.set_toggle_port_sync(enums.OnOff.ON)
                 for port_struct in self.port_structs
-            ]
+            )
         )
         # Delay After Sync On
-        start_time = time.time()
-        for port_struct in self.port_structs:
-            while not port_struct.properties.sync_status:
-                await asyncio.sleep(const.DELAY_CHECK_SYNC)
-                if time.time() - start_time > 30:
-                    raise TimeoutError(
-                        f"Waiting for {port_struct.port_identity.name} sync timeout!"
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(
+                    *(
+                        port_struct.properties.sync_event.wait()
+                        for port_struct in self.port_structs
                     )
+                ),
+                timeout=const.TIMEOUT_CHECK_SYNC,
+            )
+        except asyncio.TimeoutError:
+            # sync can come back right at the timeout, only fail on ports that are still out of sync
+            unsynced_ports = [
+                port_struct.port_identity.name
+                for port_struct in self.port_structs
+                if not port_struct.properties.sync_status
+            ]
+            if unsynced_ports:
+                raise exceptions.PortSyncTimeout(unsynced_ports)
         await asyncio.sleep(self.__test_conf.delay_after_sync_on_second)
 
     def resolve_port_relations(self) -> None:
@@ -228,22 +251,26 @@ class ResourceManager:
         await asyncio.gather(*tasks)
 
     async def setup_packet_size(self, current_packet_size: Union[float, int]) -> None:
-        if self.__test_conf.frame_sizes.packet_size_type.is_fix:
+        packet_size_type = self.__test_conf.frame_sizes.packet_size_type
+        if packet_size_type.is_fix:
             min_size = max_size = int(current_packet_size)
         else:
             (
                 min_size,
                 max_size,
             ) = self.__test_conf.size_range
+        packet_size_type_xmp = packet_size_type.to_xmp()
         await asyncio.gather(
-            *[
-                port_struct.set_streams_packet_size(
-                    self.__test_conf.frame_sizes.packet_size_type.to_xmp(),
-                    min_size,
-                    max_size,
+            *(
+                apply_in_batches(
+                    port_struct.set_streams_packet_size(
+                        packet_size_type_xmp,
+                        min_size,
+                        max_size,
+                    )
                 )
                 for port_struct in self.port_structs
-            ]
+            )
         )
 
     async def set_gap_monitor(
@@ -255,45 +282,48 @@ class ResourceManager:
         if not use_gap_monitor:
             return
         await asyncio.gather(
-            *[
+            *(
                 port_struct.set_gap_monitor(
                     gap_monitor_start_microsec, gap_monitor_stop_frames
                 )
                 for port_struct in self.rx_ports
-            ]
+            )
         )
 
     def test_running(self) -> bool:
         return any(
-            port_struct.properties.traffic_status for port_struct in self.tx_ports
+            port_struct.properties.traffic_status for port_struct in self._tx_ports
         )
 
     def test_finished(self) -> bool:
         return all(
-            not port_struct.properties.traffic_status for port_struct in self.tx_ports
+            not port_struct.properties.traffic_status for port_struct in self._tx_ports
         )
 
     def los(self) -> bool:
-        if self.__test_conf.should_stop_on_los:
+        if self._should_stop_on_los:
             return not all(
                 port_struct.properties.sync_status for port_struct in self.port_structs
             )
         return False
 
-    def should_quit(
-        self, start_time: float, actual_duration: float
-    ) -> Tuple[bool, bool]:
-        test_finished = self.test_finished()
-        elapsed = time.time() - start_time
-        actual_duration_elapsed = (
-            elapsed >= actual_duration + const.DELAY_TEST_MUST_FINISH
+    @staticmethod
+    def get_deadline_ns(actual_duration: float) -> int:
+        """ monotonic clock deadline for should_quit, test must finish in actual duration plus a delay """
+        return time.monotonic_ns() + int(
+            (actual_duration + const.DELAY_TEST_MUST_FINISH) * 1_000_000_000
         )
+
+    def should_quit(self, deadline_ns: int) -> Tuple[bool, bool]:
+        test_finished = self.test_finished()
+        actual_duration_elapsed = time.monotonic_ns() >= deadline_ns
         los = self.los()
         if los:
             raise exceptions.TestAbort()
         should_quit = test_finished or los or actual_duration_elapsed
-        port_should_stop = [port._should_stop_on_los for port in self.port_structs]
-        should_fail = los and any(port_should_stop)
+        should_fail = los and any(
+            port._should_stop_on_los for port in self.port_structs
+        )
         return should_quit, should_fail
 
     def set_rate_percent(self, rate: float) -> None:
@@ -302,32 +332,37 @@ class ResourceManager:
 
     async def set_tx_time_limit(self, tx_timelimit: Union[float, int]) -> None:
         """throughput & latency & frame loss support txtimelimit"""
+        tx_timelimit_int = int(tx_timelimit)
         await asyncio.gather(
-            *[
-                port_struct.set_tx_time_limit(int(tx_timelimit))
+            *(
+                port_struct.set_tx_time_limit(tx_timelimit_int)
                 for port_struct in self.tx_ports
-            ]
+            )
         )
 
     async def set_frame_limit(self, frame_count: int) -> None:
         """back to back supoort packetlimit"""
         await asyncio.gather(
-            *[
-                stream_struct.set_frame_limit(frame_count)
+            *(
+                apply_in_batches(
+                    [
+                        stream_struct.set_frame_limit(frame_count)
+                        for stream_struct in port_struct.stream_structs
+                    ]
+                )
                 for port_struct in self.tx_ports
-                for stream_struct in port_struct.stream_structs
-            ]
+            )
         )
 
     async def clear_statistic(self) -> None:
         await asyncio.gather(
-            *[port_struct.clear_statistic() for port_struct in self.port_structs]
+            *(port_struct.clear_statistic() for port_struct in self.port_structs)
         )
         await asyncio.sleep(const.DELAY_CLEAR_STATISTICS)
 
     async def query_traffic_status(self) -> None:
         await asyncio.gather(
-            *[port_struct.get_traffic_status() for port_struct in self.tx_ports]
+            *(port_struct.get_traffic_status() for port_struct in self.tx_ports)
         )
 
     async def start_traffic_sync(
@@ -342,15 +377,15 @@ class ResourceManager:
     async def start_traffic(self, port_sync: bool = False) -> None:
         if not port_sync:
             # send P_TRAFFIC every port
-            await utils.apply(
-                *[
+            await apply_in_batches(
+                [
                     port_struct.set_traffic(enums.StartOrStop.START)
                     for port_struct in self.tx_ports
                 ]
             )
         elif len(self.mapping) == 1:
             # same tester send C_TRAFFIC
-            tester_id = list(self.mapping.keys())[0]
+            tester_id = next(iter(self.mapping))
             tester = self.__testers[tester_id]
             await tester.traffic.set(
                 enums.OnOff(enums.StartOrStop.START), self.mapping[tester_id]
@@ -359,19 +394,27 @@ class ResourceManager:
         else:
             # multi tester need to use c_trafficsync cmd
             await asyncio.gather(
-                *[
+                *(
                     self.start_traffic_sync(self.__testers[tester_id], module_port_list)
                     for tester_id, module_port_list in self.mapping.items()
-                ]
+                )
             )
 
+    @staticmethod
+    async def _collect_port(port_struct: "PortStruct") -> None:
+        """ query a port and its streams, the port consumes the results of its own tokens in order """
+        results = await apply_in_batches(port_struct.query_tokens())
+        port_struct.update(iter(results))
+
     async def collect(
         self, packet_size: float, duration: float, is_final: bool = False
     ) -> None:
+        # stream query aggregates rx statistic on peer ports, so every counter is reset before the first query
         for port_struct in self.port_structs:
             port_struct.init_counter(packet_size, duration, is_final)
         await asyncio.gather(
-            *[port_struct.query() for port_struct in self.port_structs]
+            *(self._collect_port(port_struct) for port_struct in self.port_structs)
         )
+        # and rate can only be calculated after all queries
         for port_struct in self.port_structs:
             port_struct.statistic.calculate_rate()
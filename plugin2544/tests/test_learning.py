@@ -0,0 +1,50 @@
+import pytest
+
+learning = pytest.importorskip("plugin2544.plugin.learning")
+from plugin2544.plugin.data_model import AddressModifier
+from plugin2544.utils.field import IPv4Address, IPv6Address
+
+
+def test_address_list_without_modifier():
+    source_ip = IPv4Address("10.0.0.1")
+    assert learning.get_address_list(source_ip, None) == [source_ip]
+
+
+def test_address_list_within_last_octet():
+    modifier = AddressModifier(range(1, 4), offset=2, mask=0xFFFF)
+    assert learning.get_address_list(IPv4Address("10.0.0.9"), modifier) == [
+        IPv4Address("10.0.0.1"),
+        IPv4Address("10.0.0.2"),
+        IPv4Address("10.0.0.3"),
+    ]
+
+
+def test_address_list_beyond_last_octet():
+    # a 16 bit modifier on the last two bytes covers values above 0xFF
+    modifier = AddressModifier(range(0xFF, 0x102), offset=2, mask=0xFFFF)
+    assert learning.get_address_list(IPv4Address("10.0.0.9"), modifier) == [
+        IPv4Address("10.0.0.255"),
+        IPv4Address("10.0.1.0"),
+        IPv4Address("10.0.1.1"),
+    ]
+
+
+def test_address_list_follows_offset_and_mask():
+    # only the low byte of the word at offset 0 is modified, that is the second octet
+    modifier = AddressModifier(range(5, 7), offset=0, mask=0x00FF)
+    assert learning.get_address_list(IPv4Address("10.0.0.9"), modifier) == [
+        IPv4Address("10.5.0.9"),
+        IPv4Address("10.6.0.9"),
+    ]
+
+
+def test_address_list_ipv6_hextets():
+    last_hextet = AddressModifier(range(0xFFFE, 0x10000), offset=14, mask=0xFFFF)
+    assert learning.get_address_list(IPv6Address("2001::1"), last_hextet) == [
+        IPv6Address("2001::fffe"),
+        IPv6Address("2001::ffff"),
+    ]
+    second_last_hextet = AddressModifier(range(5, 6), offset=12, mask=0xFFFF)
+    assert learning.get_address_list(IPv6Address("2001::1"), second_last_hextet) == [
+        IPv6Address("2001::5:1"),
+    ]
@@ -0,0 +1,28 @@
+import asyncio
+import functools
+from typing import Any, Awaitable, Callable, Dict, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def coalesce(
+    func: Callable[..., Awaitable[T]]
+) -> Callable[..., Awaitable[T]]:
+    """
+    concurrent calls of the same coroutine method with the same arguments on the same instance
+    share one in-flight call, so only one command is sent to the tester.
+    """
+    attr = f"_coalesce_{func.__name__}"
+
+    @functools.wraps(func)
+    async def wrapper(self: Any, *args: Any) -> T:
+        pending: Dict[Tuple[Any, ...], "asyncio.Future[T]"] = self.__dict__.setdefault(attr, {})
+        future = pending.get(args)
+        if future is None:
+            future = asyncio.ensure_future(func(self, *args))
+            pending[args] = future
+            future.add_done_callback(lambda _: pending.pop(args, None))
+        # shield the shared call, a cancelled caller should not cancel the others
+        return await asyncio.shield(future)
+
+    return wrapper
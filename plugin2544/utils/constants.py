@@ -19,7 +19,7 @@ MICRO_TPLD_TOTAL_LENGTH = MICRO_TPLD_LENGTH + ETHERNET_FCS_LENGTH
 STANDARD_TPLD_TOTAL_LENGTH = (
     STANDARD_TPLD_LENGTH + MIN_PAYLOAD_LENGTH + ETHERNET_FCS_LENGTH
 )
-MIN_REFRESH_TIMER_INTERNAL = 100.0
+MIN_REFRESH_TIMER_INTERNAL = 100  # unit: ms
 DEFAULT_PACKET_SIZE_LIST = (64, 128, 256, 512, 1024, 1280, 1518)
 MIXED_PACKET_SIZE = (
     56,
@@ -42,6 +42,7 @@ MIXED_PACKET_SIZE = (
 MIXED_DEFAULT_WEIGHTS = (0, 0, 0, 0, 57, 3, 5, 1, 2, 5, 1, 4, 4, 18, 0, 0)
 MIXED_PACKET_CONFIG_LENGTH_INDICES = (0, 1, 14, 15)
 MAX_PACKET_LIMIT_VALUE = 0x7FFFFFFF
+MAX_COMMANDS_PER_APPLY = 200  # driver limit of commands in one utils.apply
 
 STANDARD_SEGMENT_VALUE = (128, 256, 512, 1024, 2048)
 
@@ -73,12 +74,14 @@ DELAY_LEARNING_ARP = 1
 DELAY_LEARNING_MAC = 1
 DELAY_STATISTICS = 5
 DELAY_STOPPED_TRAFFIC = 1
-DELAY_CHECK_SYNC = 1
 DELAY_TEST_MUST_FINISH = 10
 DELAY_CLEAR_STATISTICS = 1
 INTERVAL_CHECK_LEARNING_TRAFFIC = 0.1
 INTERVAL_SEND_STATISTICS = 1
 
+# for asyncio.wait_for
+TIMEOUT_CHECK_SYNC = 30
+
 
 class CounterType(CaseInsensitiveEnum):
     JITTER = -1
@@ -1,11 +1,15 @@
 import struct
-from typing import Union
+from typing import Iterable, List, Union
 from dataclasses import dataclass
 from enum import Enum
 from .field import MacAddress, IPv4Address, IPv6Address
 from .traffic_definitions import EtherType, NextHeaderOption
 
 
+# bytes before ARP sender ip: ethernet header 14 + ARP fixed fields 8 + sender mac 6
+ARP_SENDER_IP_OFFSET = 28
+
+
 def padding(num) -> str:
     return "0" * num
 
@@ -174,3 +178,13 @@ class ARPPacket(Packet):
             + self.hexstring
             + padding(44)
         )
+
+    def make_arp_packets(self, source_ips: Iterable[IPv4Address]) -> List[str]:
+        """ packets only differ in sender ip, format once and patch sender ip for each source ip """
+        template = self.make_arp_packet()
+        head = template[: ARP_SENDER_IP_OFFSET * 2]
+        tail = template[(ARP_SENDER_IP_OFFSET + 4) * 2 :]
+        return [
+            f"{head}{IPv4Address(source_ip).to_hexstring()}{tail}"
+            for source_ip in source_ips
+        ]
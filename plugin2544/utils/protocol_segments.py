@@ -1,8 +1,11 @@
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple, Union
+from ..model.m_protocol_segment import wrap_add_16
+from ..utils.field import IPv4Address, IPv6Address
 
 if TYPE_CHECKING:
-    from ..model.m_protocol_segment import ProtocolSegment
-    from ..utils.field import IPv4Address, IPv6Address, MacAddress
+    from ..model.m_protocol_segment import ProtocolSegment, ProtocolSegmentProfileConfig
+    from ..plugin.data_model import AddressCollection
+    from ..utils.field import MacAddress
 
 
 ETHERNET_ADDRESS_SRC = "Src MAC addr"
@@ -42,3 +45,109 @@ def setup_segment_ipv6(
         segment[IPV6_ADDRESS_SRC] = src_ipv6.to_binary_string()
     if not dst_ipv6 or segment[IPV6_ADDRESS_DST].is_all_zero:
         segment[IPV6_ADDRESS_DST] = dst_ipv6.to_binary_string()
+
+
+class PacketHeaderTemplate:
+    """
+    prepared packet header of a profile, with the positions of the all zero address fields
+    which the setup_segment_* functions would fill in. Every stream of a port shares the
+    profile, so the header is built once and each stream only patches its own addresses.
+    """
+
+    def __init__(self, profile: "ProtocolSegmentProfileConfig") -> None:
+        self._data = bytearray()
+        # field name -> (byte offset, byte length, segment index)
+        self._patches: Dict[str, List[Tuple[int, int, int]]] = {}
+        # segment index -> (byte offset, byte length, checksum offset)
+        self._checksums: Dict[int, Tuple[int, int, int]] = {}
+        # patch values -> finished header and its hex string, streams may share their addresses
+        self._headers: Dict[Tuple[Tuple[str, bytes], ...], Tuple[bytes, str]] = {}
+        self.is_usable = self._build(profile)
+
+    def _add_patch(
+        self, segment: "ProtocolSegment", index: int, segment_bit_position: int, name: str
+    ) -> bool:
+        bit_position = segment_bit_position
+        for field in segment.fields:
+            if field.name == name:
+                break
+            bit_position += field.bit_length
+        field = segment[name]
+        if bit_position % 8 or field.bit_length % 8:
+            return False
+        if field.is_all_zero:
+            self._patches.setdefault(name, []).append(
+                (bit_position // 8, field.bit_length // 8, index)
+            )
+        return True
+
+    def _build(self, profile: "ProtocolSegmentProfileConfig") -> bool:
+        bit_position = 0
+        for index, segment in enumerate(profile.segments):
+            if any(f.value_range for f in segment.fields) or segment.bit_length % 8:
+                # value ranges and bit aligned segments are prepared per stream
+                return False
+            if segment.type.is_ethernet and index == 0:
+                field_names: Tuple[str, ...] = (ETHERNET_ADDRESS_DST, ETHERNET_ADDRESS_SRC)
+            elif segment.type.is_ipv4:
+                field_names = (IPV4_ADDRESS_SRC, IPV4_ADDRESS_DST)
+            elif segment.type.is_ipv6:
+                field_names = (IPV6_ADDRESS_SRC, IPV6_ADDRESS_DST)
+            else:
+                field_names = ()
+            for name in field_names:
+                if not self._add_patch(segment, index, bit_position, name):
+                    return False
+            if segment.checksum_offset:
+                self._checksums[index] = (
+                    bit_position // 8,
+                    segment.bit_length // 8,
+                    segment.checksum_offset,
+                )
+            bit_position += segment.bit_length
+        self._data = profile.prepare()
+        return True
+
+    def _get_patch_values(self, addr_coll: "AddressCollection") -> Dict[str, bytes]:
+        values: Dict[str, bytes] = {}
+        arp_mac = addr_coll.arp_mac
+        dst_mac = addr_coll.dmac if not arp_mac or arp_mac.is_empty else arp_mac
+        if not dst_mac.is_empty:
+            values[ETHERNET_ADDRESS_DST] = dst_mac.to_bytearray()
+        if not addr_coll.smac.is_empty:
+            values[ETHERNET_ADDRESS_SRC] = addr_coll.smac.to_bytearray()
+        src_addr, dst_addr = addr_coll.src_addr, addr_coll.dst_addr
+        if isinstance(src_addr, IPv4Address) and isinstance(dst_addr, IPv4Address):
+            values[IPV4_ADDRESS_SRC] = src_addr.packed
+            values[IPV4_ADDRESS_DST] = dst_addr.packed
+        elif isinstance(src_addr, IPv6Address) and isinstance(dst_addr, IPv6Address):
+            values[IPV6_ADDRESS_SRC] = src_addr.packed
+            values[IPV6_ADDRESS_DST] = dst_addr.packed
+        return values
+
+    def build(self, addr_coll: "AddressCollection") -> Tuple[bytes, str]:
+        """ packet header with the stream addresses and its hex string, checksums of patched segments recalculated """
+        values = self._get_patch_values(addr_coll)
+        key = tuple((name, bytes(value)) for name, value in values.items())
+        if (header := self._headers.get(key)) is None:
+            header = self._headers[key] = self._patch(values)
+        return header
+
+    def _patch(self, values: Dict[str, bytes]) -> Tuple[bytes, str]:
+        data = self._data.copy()
+        patched: Set[int] = set()
+        for name, value in values.items():
+            for offset, length, index in self._patches.get(name, ()):
+                if len(value) != length:
+                    raise ValueError(
+                        f"new value length {len(value) * 8} not match field length {length * 8} ({name})"
+                    )
+                data[offset : offset + length] = value
+                patched.add(index)
+        for index in patched:
+            if checksum := self._checksums.get(index):
+                offset, length, checksum_offset = checksum
+                data[offset : offset + length] = wrap_add_16(
+                    data[offset : offset + length], checksum_offset
+                )
+        return bytes(data), data.hex()